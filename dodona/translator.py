@@ -29,6 +29,7 @@ class Translator:
         FAILED_TESTS = auto()
         INVALID_LANGUAGE_TRANSLATION = auto()
         INVALID_TESTSUITE_STUDENTS = auto()
+        INVALID_SUBMISSION = auto()
         EVALUATION_FAILED = auto()
         # double char exceptions
         MISSING_OPENING_CHARACTER = auto()
@@ -70,6 +71,9 @@ class Translator:
 
     def __init__(self, language: Language):
         self.language = language
+        # The language doesn't change, so look up its tables only once
+        self._texts = self.text_translations[language]
+        self._errors = self.error_translations[language]
 
     @classmethod
     def from_str(cls, language: str) -> "Translator":
@@ -90,7 +94,7 @@ class Translator:
         :param error: ErrorType enum
         :return: translated human-readable string
         """
-        return self.error_translations[self.language][error]
+        return self._errors[error]
 
     def error_status(self, error: ErrorType, **kwargs) -> Dict[str, str]:
         """translate an ErrorType enum into a status object
@@ -108,7 +112,9 @@ class Translator:
         :param kwargs: parameters for message
         :return: translated text
         """
-        return self.text_translations[self.language][message].format(**kwargs)
+        template = self._texts[message]
+        # Most messages don't take parameters, no need to format those
+        return template.format(**kwargs) if kwargs else template
 
     error_translations = {
         Language.EN: {
@@ -147,6 +153,7 @@ class Translator:
             Text.FAILED_TESTS: "{amount} test(s) failed.",
             Text.INVALID_LANGUAGE_TRANSLATION: "Translation for language {language} has less items than the checklist ({translation} instead of {checklist}). Some items will use the default value.",
             Text.INVALID_TESTSUITE_STUDENTS: "Your submission could not be evaluated because of an error in the solution file.",
+            Text.INVALID_SUBMISSION: "Your submission could not be evaluated because it is not a valid JSON graph.",
             Text.EVALUATION_FAILED: "This check could not be executed successfully. Make sure that the HTML in your submission is valid.",
             # double char exceptions
             Text.MISSING_OPENING_CHARACTER: "Missing opening character for",
@@ -195,6 +202,7 @@ class Translator:
             Text.FAILED_TESTS: "{amount} test(en) gefaald.",
             Text.INVALID_LANGUAGE_TRANSLATION: "De vertaling voor {language} bevat minder elementen dan de checklist ({translation} in plaats van {checklist}). De default waarde zal worden gebruikt voor sommige items.",
             Text.INVALID_TESTSUITE_STUDENTS: "Jouw indiening kon niet geëvalueerd worden door een fout in het oplossingsbestand.",
+            Text.INVALID_SUBMISSION: "Jouw indiening kon niet geëvalueerd worden omdat het geen geldige JSON-graaf is.",
             Text.EVALUATION_FAILED: "Deze test kon niet uitgevoerd worden. Controleer dat de HTML in de indiening geldig is.",
             # double char exceptions
             Text.MISSING_OPENING_CHARACTER: "Ontbrekend openend karakter voor",
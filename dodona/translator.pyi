@@ -18,6 +18,7 @@ class Translator:
         FAILED_TESTS = ...
         INVALID_LANGUAGE_TRANSLATION = ...
         INVALID_TESTSUITE_STUDENTS = ...
+        INVALID_SUBMISSION = ...
         EVALUATION_FAILED = ...
         # double char exceptions
         MISSING_OPENING_CHARACTER = ...
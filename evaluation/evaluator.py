@@ -1,9 +1,5 @@
 from validators.checks import HtmlSuite, TestSuite, ChecklistItem, BoilerplateTestSuite, Check, CVGSuite
 from bs4 import BeautifulSoup
-from utils.file_loaders import json_loader
-import json
-import numpy as np
-import ast
 
 
 def create_suites(content: str, solution: str) -> list[TestSuite]:
@@ -1,3 +1,6 @@
+from functools import total_ordering
+from operator import attrgetter
+
 from dodona.translator import Translator
 from exceptions.utils import DelayedExceptions, FeedbackException
 
@@ -8,6 +11,7 @@ class DoubleCharError(FeedbackException):
         super(DoubleCharError, self).__init__(trans=trans, msg=msg, line=line, pos=pos)
 
 
+@total_ordering
 class LocatableDoubleCharError(DoubleCharError):
     """Exceptions that can be located"""
 
@@ -17,21 +21,9 @@ class LocatableDoubleCharError(DoubleCharError):
     def __lt__(self, other):
         return (self.line, self.pos) < (other.line, other.pos)
 
-    def __gt__(self, other):
-        return (self.line, self.pos) > (other.line, other.pos)
-
-    def __le__(self, other):
-        return (self.line, self.pos) <= (other.line, other.pos)
-
-    def __ge__(self, other):
-        return (self.line, self.pos) >= (other.line, other.pos)
-
     def __eq__(self, other):
         return (self.line, self.pos) == (other.line, other.pos)
 
-    def __ne__(self, other):
-        return (self.line, self.pos) != (other.line, other.pos)
-
 
 class MissingOpeningCharError(LocatableDoubleCharError):
     """Exception that indicates that an opening equivalent of a certain character is missing"""
@@ -54,5 +46,5 @@ class MultipleMissingCharsError(DelayedExceptions):
         self.exceptions: [LocatableDoubleCharError]
 
     def __str__(self):
-        self.exceptions.sort()
+        self.exceptions.sort(key=attrgetter("line", "pos"))
         return f"{self.translator.translate(Translator.Text.ERRORS)} ({len(self)}):\n{self._print_exceptions()}"
@@ -1,18 +1,16 @@
 
+from operator import attrgetter
+
 from dodona.translator import Translator
 from exceptions.utils import DelayedExceptions, FeedbackException
 
 
 class HtmlValidationError(FeedbackException):
     """Base class for HTML related exceptions in this module."""
-    def __init__(self, trans: Translator, msg: str, line: int, pos: int):
-        super(HtmlValidationError, self).__init__(trans=trans, msg=msg, line=line, pos=pos)
 
 
 class LocatableHtmlValidationError(HtmlValidationError):
     """Exceptions that can be located"""
-    def __init__(self, trans: Translator, msg: str, line: int, pos: int):
-        super(LocatableHtmlValidationError, self).__init__(trans=trans, msg=msg, line=line, pos=pos)
 
 
 """
@@ -24,7 +22,7 @@ class MissingOpeningTagError(LocatableHtmlValidationError):
     """Exception that indicates that the opening tag is missing for a tag"""
     def __init__(self, trans: Translator, tag: str, line: int, pos: int):
         msg = f"{trans.translate(Translator.Text.MISSING_OPENING_TAG)} <{tag}>"
-        super(MissingOpeningTagError, self).__init__(trans=trans, msg=msg, line=line, pos=pos)
+        super().__init__(trans=trans, msg=msg, line=line, pos=pos)
 
 
 
@@ -32,20 +30,20 @@ class MissingClosingTagError(LocatableHtmlValidationError):
     """Exception that indicates that the closing tag is missing for a tag"""
     def __init__(self, trans: Translator, tag: str, line: int, pos: int):
         msg = f"{trans.translate(Translator.Text.MISSING_CLOSING_TAG)} <{tag}>"
-        super(MissingClosingTagError, self).__init__(trans=trans, msg=msg, line=line, pos=pos)
+        super().__init__(trans=trans, msg=msg, line=line, pos=pos)
 
 
 class InvalidTagError(LocatableHtmlValidationError):
     """Exception that indicates that a tag is invalid (tag doesn't exist or isn't allowed to be used"""
     def __init__(self, trans: Translator, tag: str, line: int, pos: int):
         msg = f"{trans.translate(Translator.Text.INVALID_TAG)}: <{tag}>"
-        super(InvalidTagError, self).__init__(trans=trans, msg=msg, line=line, pos=pos)
+        super().__init__(trans=trans, msg=msg, line=line, pos=pos)
 
 
 class NoSelfClosingTagError(LocatableHtmlValidationError):
     def __init__(self, trans: Translator, tag: str, line: int, pos: int):
         msg = f"{trans.translate(Translator.Text.NO_SELF_CLOSING_TAG)}: <{tag}>"
-        super(NoSelfClosingTagError, self).__init__(trans=trans, msg=msg, line=line, pos=pos)
+        super().__init__(trans=trans, msg=msg, line=line, pos=pos)
 
 
 class UnexpectedTagError(LocatableHtmlValidationError):
@@ -54,7 +52,7 @@ class UnexpectedTagError(LocatableHtmlValidationError):
     """
     def __init__(self, trans: Translator, tag: str, line: int, pos: int):
         msg = f"{trans.translate(Translator.Text.UNEXPECTED_TAG)}: <{tag}>"
-        super(UnexpectedTagError, self).__init__(trans=trans, msg=msg, line=line, pos=pos)
+        super().__init__(trans=trans, msg=msg, line=line, pos=pos)
 
 
 class UnexpectedClosingTagError(LocatableHtmlValidationError):
@@ -63,7 +61,7 @@ class UnexpectedClosingTagError(LocatableHtmlValidationError):
     """
     def __init__(self, trans: Translator, tag: str, line: int, pos: int):
         msg = f"{trans.translate(Translator.Text.UNEXPECTED_CLOSING_TAG, tag=tag)}"
-        super(UnexpectedClosingTagError, self).__init__(trans=trans, msg=msg, line=line, pos=pos)
+        super().__init__(trans=trans, msg=msg, line=line, pos=pos)
 
 
 """
@@ -76,7 +74,7 @@ class InvalidAttributeError(LocatableHtmlValidationError):
     def __init__(self, trans: Translator, tag: str, attribute: str, line: int, pos: int):
         msg = f"{trans.translate(Translator.Text.INVALID_ATTRIBUTE)} <{tag}>: " \
                f"{attribute}"
-        super(InvalidAttributeError, self).__init__(trans=trans, msg=msg, line=line, pos=pos)
+        super().__init__(trans=trans, msg=msg, line=line, pos=pos)
 
 
 class MissingRequiredAttributesError(LocatableHtmlValidationError):
@@ -84,19 +82,19 @@ class MissingRequiredAttributesError(LocatableHtmlValidationError):
     def __init__(self, trans: Translator, tag: str, attribute: str, line: int, pos: int):
         msg = f"{trans.translate(Translator.Text.MISSING_REQUIRED_ATTRIBUTE)} <{tag}>: " \
                f"{attribute}"
-        super(MissingRequiredAttributesError, self).__init__(trans=trans, msg=msg, line=line, pos=pos)
+        super().__init__(trans=trans, msg=msg, line=line, pos=pos)
 
 
 class DuplicateIdError(LocatableHtmlValidationError):
     """Exception that indicates that an id is used twice"""
     def __init__(self, trans: Translator, tag: str, attribute: str, line: int, pos: int):
         msg = f"{trans.translate(Translator.Text.DUPLICATE_ID, id=attribute, tag=tag)}"
-        super(DuplicateIdError, self).__init__(trans=trans, msg=msg, line=line, pos=pos)
+        super().__init__(trans=trans, msg=msg, line=line, pos=pos)
 
 
 class AttributeValueError(LocatableHtmlValidationError):
     def __init__(self, trans: Translator, msg: str, line: int, pos: int):
-        super(AttributeValueError, self).__init__(trans=trans, msg=msg, line=line, pos=pos)
+        super().__init__(trans=trans, msg=msg, line=line, pos=pos)
 
 
 class MissingRecommendedAttributesWarning(LocatableHtmlValidationError):
@@ -107,7 +105,7 @@ class MissingRecommendedAttributesWarning(LocatableHtmlValidationError):
     def __init__(self, trans: Translator, tag: str, attribute: str, line: int, pos: int):
         msg = f"{trans.translate(Translator.Text.MISSING_RECOMMENDED_ATTRIBUTE)} <{tag}>: " \
                f"{attribute}"
-        super(MissingRecommendedAttributesWarning, self).__init__(trans=trans, msg=msg, line=line, pos=pos)
+        super().__init__(trans=trans, msg=msg, line=line, pos=pos)
 
 
 class Warnings(DelayedExceptions):
@@ -115,7 +113,15 @@ class Warnings(DelayedExceptions):
         super().__init__()
         self.translator = translator
         self.exceptions: [LocatableHtmlValidationError]  # makes them sortable
+        self._sorted = True
+
+    def add(self, exception: LocatableHtmlValidationError):
+        super().add(exception)
+        self._sorted = False
 
     def __str__(self):
-        self.exceptions.sort(key=lambda x: (x.line, x.pos))
+        # Only sort again when warnings were added since the last time
+        if not self._sorted:
+            self.exceptions.sort(key=attrgetter("line", "pos"))
+            self._sorted = True
         return f"{self.translator.translate(Translator.Text.WARNINGS)} ({len(self)}):\n{self._print_exceptions()}"
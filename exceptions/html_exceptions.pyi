@@ -5,12 +5,10 @@ from exceptions.utils import DelayedExceptions, FeedbackException
 
 
 class HtmlValidationError(FeedbackException):
-    def __init__(self, trans: Translator, msg: str, line: int, pos: int):
-        ...
+    ...
 
 class LocatableHtmlValidationError(HtmlValidationError):
-    def __init__(self, trans: Translator, msg: str, line: int, pos: int):
-        ...
+    ...
 
 class MissingOpeningTagError(LocatableHtmlValidationError):
     def __init__(self, trans: Translator, tag: str, line: int, pos: int):
@@ -1,7 +1,11 @@
+from typing import Optional
+
 from dodona.translator import Translator
 
 
 class FeedbackException(Exception):
+    __slots__ = ("msg", "line", "pos", "trans", "_cached_msg")
+
     msg: str
     line: int
     pos: int
@@ -13,12 +17,17 @@ class FeedbackException(Exception):
         self.line = line - 1  # 1-based to 0-based
         self.pos = pos
         self.trans = trans
+        self._cached_msg: Optional[str] = None
 
     def __str__(self) -> str:
         return self.message_str()
 
     def message_str(self) -> str:
         """Create the message that should be displayed in the Dodona Tab"""
+        # Warnings get printed, sorted and joined more than once, only translate once
+        if self._cached_msg is not None:
+            return self._cached_msg
+
         # Line number < 0 means no line number should be shown (eg. empty submission)
         # Same for position
         out = self.msg
@@ -27,6 +36,7 @@ class FeedbackException(Exception):
         if self.pos >= 0:
             out += f" {self.trans.translate(Translator.Text.POSITION)} {self.pos + 1}"
 
+        self._cached_msg = out
         return out
 
     def annotation_str(self):
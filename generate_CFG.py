@@ -1,8 +1,12 @@
-import angr
-import matplotlib.pyplot as plt
+import argparse
+import heapq
 import json
 import subprocess
-import sys
+
+# whether an edge of a given jumpkind is dashed (fall-through) or not,
+# "decide" means it depends on where the jump lands
+EDGE_DASHES = {"Ijk_Ret": False, "Ijk_Call": False,
+               "Ijk_FakeRet": True, "Ijk_Boring": "decide"}
 
 # make a dict of hexadecimal and decimal adresses
 # def gen_dicts(cfg):
@@ -26,15 +30,27 @@ import sys
 #             addr_list.append("0x%x" %(insn.address))
 #     return addr_list
 
-def gen_instr_list(cfg):
-    instr_dict = {}
-    for node in cfg.nodes():
-        block = node.block
-        # Iterate over all instructions in the block
-        for insn in block.capstone.insns:
-            instr_dict[insn.address] = f"{insn.mnemonic} {insn.op_str}"
-    sorted_instr_list = sorted(instr_dict.items(), key=lambda x: x[0])
+# disassemble every block once, capstone re-decodes on every .insns access
+def gen_node_insns(cfg):
+    return {node: list(node.block.capstone.insns) for node in cfg.nodes()}
+
+
+def gen_instr_list(cfg, node_insns):
+    # Instructions inside a block are already sorted by address,
+    # so merging the blocks is enough to sort all of them
+    blocks = [[(insn.address, f"{insn.mnemonic} {insn.op_str}") for insn in node_insns[node]]
+              for node in cfg.nodes()]
+    sorted_instr_list = []
+    for addr, instr in heapq.merge(*blocks, key=lambda x: x[0]):
+        # Overlapping blocks share instructions, only keep one of them
+        if not sorted_instr_list or sorted_instr_list[-1][0] != addr:
+            sorted_instr_list.append((addr, instr))
     return sorted_instr_list
+
+
+# map every instruction address to its index in the sorted instruction list
+def gen_addr_index(instr_list):
+    return {addr: i for i, (addr, _) in enumerate(instr_list)}
 # get the raw text from the node
 # def get_node_text(node,func_hexwb,func_decwb,addr_list):
 #     nodestr = ""
@@ -52,116 +68,108 @@ def gen_instr_list(cfg):
 # function that decides wether the arrow is full or dashed
 
 
-def decide_jump(src, dest, instr_list):
-    src_ins = src.block.capstone.insns[-1]
-    dest_ins = dest.block.capstone.insns[0]
-    index_src = [el[0] for el in instr_list].index(src_ins.address)
-    index_dest = [el[0] for el in instr_list].index(dest_ins.address)
-    if index_dest-index_src == 1:
-        return True
-    return False
+def decide_jump(src, dest, first_index, last_index):
+    return first_index[dest] - last_index[src] == 1
+
 
+def get_insns(node, addr_index, node_insns):
+    return ",".join(str(addr_index[insn.address]) for insn in node_insns[node])
 
-def get_insns(node, instr_list):
-    nodeinsns = ""
-    for insn in node.block.capstone.insns:
-        nodeinsns += str([el[0]
-                         for el in instr_list].index(insn.address)) + ","
 
-    return nodeinsns[:-1]
+# the instruction string of every node, built once instead of once per edge
+def gen_node_text(cfg, addr_index, node_insns):
+    return {node: get_insns(node, addr_index, node_insns) for node in cfg.nodes()}
 
 # create the nodes that will be in the nodes json
 
 
-def create_nodes(cfg, instr_list):
-    nodelist = []
+def create_nodes(cfg, node_text):
+    nodelist = [node_text[node] for node in cfg.nodes()]
     extra_edges = []
     changed_nodes = {}
-    for node in cfg.nodes():
-        nodeinsns = get_insns(node, instr_list)
-        inslist = nodeinsns.split(",")
-        nodelist.append(nodeinsns)
-    for j in range(len(nodelist)):  # needed for nodes that do not end in return
-        copynodes = nodelist.copy()
-        copynodes.remove(nodelist[j])
-        for i in range(len(nodelist[j])):
-            if (nodelist[j][i:] in copynodes):
-                nodeinsns = nodelist[j][i:]
+    nodeset = set(nodelist)
+    split_nodes = []
+    for node in nodelist:  # needed for nodes that do not end in return
+        # Split on the instruction indices, slicing the string could cut an index in half
+        insns = node.split(",")
+        for i in range(1, len(insns)):
+            suffix = ",".join(insns[i:])
+            # The end of this node is another node, keep only the start
+            # and let it fall through into the other one
+            if suffix in nodeset:
+                prefix = ",".join(insns[:i])
                 extra_edges.append(
-                    {"dashes": True, "from": nodelist[j][:i-1], "to": nodelist[j][i:]})
-                changed_nodes[nodelist[j]] = nodelist[j][:i-1]
-                nodelist.append(nodelist[j][:i-1])
-                nodelist.remove(nodelist[j])
+                    {"dashes": True, "from": prefix, "to": suffix})
+                changed_nodes[node] = prefix
+                split_nodes.append(prefix)
+                break
+    nodelist = [node for node in nodelist if node not in changed_nodes]
+    nodelist.extend(split_nodes)
 
     return nodelist, extra_edges, changed_nodes
 
 
 # create the edges that will be in the edges json
-def create_edges(cfg, instr_list, changed_nodes):
-    edgedict = {"Ijk_Ret": False, "Ijk_Call": False,
-                "Ijk_FakeRet": True, 'Ijk_Boring': "decide"}
+def create_edges(cfg, addr_index, node_insns, node_text, changed_nodes):
+    # index of the first and last instruction of every node
+    first_index = {node: addr_index[insns[0].address]
+                   for node, insns in node_insns.items() if insns}
+    last_index = {node: addr_index[insns[-1].address]
+                  for node, insns in node_insns.items() if insns}
     edges = []
-    fromlist = []
-    tolist = []
     for src, dst, data in cfg.graph.edges(data=True):
         edge = {}
-        edge_kind = data["jumpkind"]
-        edge["dashes"] = edgedict[edge_kind]
+        edge["dashes"] = EDGE_DASHES[data["jumpkind"]]
         if (edge["dashes"] == "decide"):
-            edge["dashes"] = decide_jump(src, dst, instr_list)
-        edge["from"] = get_insns(src, instr_list)
-        edge["to"] = get_insns(dst, instr_list)
-        if (edge["to"] in changed_nodes.keys()):
-            edge["to"] = changed_nodes[edge["to"]]
-        json_edge = json.dumps(edge, indent=3)
-        if (edge["from"] not in changed_nodes.keys()):
+            edge["dashes"] = decide_jump(src, dst, first_index, last_index)
+        edge["from"] = node_text[src]
+        to = node_text[dst]
+        edge["to"] = changed_nodes.get(to, to)
+        if (edge["from"] not in changed_nodes):
             edges.append(edge)
 
     return edges
 
 
 if __name__ == "__main__":
-    file = sys.argv[1]
-    with open(file, "r") as file:
+    parser = argparse.ArgumentParser(
+        description="Generate the solution.json control flow graph of an assembly file")
+    parser.add_argument("inputfile")
+    parser.add_argument("architecture", type=str.lower, choices=["intel", "att", "arm"],
+                        help="intel, att (=AT&T) or arm")
+    args = parser.parse_args()
+
+    # angr takes seconds to import, only pay for it when actually generating a graph
+    import angr
+
+    with open(args.inputfile, "r") as file:
         solution_content = file.read()
     writefile = "writefile.s"
-    try:
-        if sys.argv[2].lower() == "intel":
-            with open(writefile, "w") as file2:
-                file2.write(".intel_syntax noprefix\n" +
-                            solution_content + "\n")
-            proc = subprocess.run(f"as {writefile} -o runcode", shell=True)
-        elif sys.argv[2].lower() == "att":
-            with open(writefile, "w") as file2:
-                file2.write(solution_content)
-            proc = subprocess.run(f"as {writefile} -o runcode", shell=True)
-        elif sys.argv[2].lower() == "arm":
-            with open(writefile, "w") as file2:
-                file2.write(solution_content)
-            proc = subprocess.run(
-                f"arm-linux-gnueabihf-as {writefile} -o runcode", shell=True)
-
+    with open(writefile, "w") as file2:
+        if args.architecture == "intel":
+            file2.write(".intel_syntax noprefix\n" + solution_content + "\n")
         else:
-            print(
-                "ERROR:Wrong architecture\nCorrect architectures: intel, ATT (=AT&T), ARM")
-
-    except:
-        print("ERROR:No architecture given.\nCorrect usage: python3 generateCVG.py <inputfile> <architecture> ")
+            file2.write(solution_content)
+    assembler = "arm-linux-gnueabihf-as" if args.architecture == "arm" else "as"
+    subprocess.run(f"{assembler} {writefile} -o runcode", shell=True)
 
     p = angr.Project("runcode", auto_load_libs=False)
     # Perform full program analysis
     cfg = p.analyses.CFGFast()
     # func_hexwb, func_decwb = gen_dicts(cfg)
     # addr_list = gen_addr_list(cfg)
-    instr_list = gen_instr_list(cfg)
-    nodelist, extra_edges, changed_nodes = create_nodes(cfg, instr_list)
-    edgeslist = create_edges(cfg, instr_list, changed_nodes)
-    for edge in extra_edges:
-        edgeslist.append(edge)
+    node_insns = gen_node_insns(cfg)
+    instr_list = gen_instr_list(cfg, node_insns)
+    addr_index = gen_addr_index(instr_list)
+    node_text = gen_node_text(cfg, addr_index, node_insns)
+    nodelist, extra_edges, changed_nodes = create_nodes(cfg, node_text)
+    edgeslist = create_edges(
+        cfg, addr_index, node_insns, node_text, changed_nodes)
+    edgeslist.extend(extra_edges)
     graph_dict = {
         'nodes': nodelist,
         'edges': edgeslist
     }
-    graph_json = json.dumps(graph_dict, indent=2)
+    # Encode straight into the file instead of building one big string first
     with open("solution.json", "w") as outfile:
-        outfile.write(graph_json)
+        json.dump(graph_dict, outfile, indent=2)
@@ -12,7 +12,7 @@ from utils.file_loaders import json_loader
 from validators import checks
 from validators.checks import TestSuite
 from utils.render_ready import prep_render
-from utils.messages import invalid_suites, invalid_evaluator_file, missing_create_suite, missing_evaluator_file, no_suites_found, missing_sol_file
+from utils.messages import invalid_submission, invalid_suites, invalid_evaluator_file, missing_create_suite, missing_evaluator_file, no_suites_found, missing_sol_file
 
 
 def main():
@@ -30,9 +30,16 @@ def main():
 
         # Initiate translator
         config.translator = Translator.from_str(config.natural_language)
-        # Load HTML
-        json_content: str = json_loader(config.source, shorted=False)
-        nodes = json_content["nodes"]
+        # Load the submitted graph, the suites get the raw text
+        # Parse it here first, so a malformed graph is reported to the student and not as an evaluator error
+        with open(config.source, "r") as file:
+            json_text: str = file.read()
+
+        try:
+            json_content: dict = json.loads(json_text)
+        except ValueError:
+            invalid_submission(judge, config)
+            return
 
         # Compile evaluator code & create test suites
         # If anything goes wrong, show a detailed error message to the teacher
@@ -47,7 +54,7 @@ def main():
                     missing_sol_file(config.translator)
                     return
                 test_suites: List[TestSuite] = evaluator.create_suites(
-                    str(json_content), solution)
+                    json_text, solution)
             else:
                 solution = json_loader(os.path.join(
                     config.resources, "./solution.json"))
@@ -89,7 +96,6 @@ def main():
 
         # Run all test suites
         for suite in test_suites:
-            print
             suite.create_validator(config)
 
             with Tab(suite.name):
@@ -1,3 +1,5 @@
+from functools import lru_cache
+
 from colour import Color as Col
 
 
@@ -29,12 +31,13 @@ class Color(Col):
             return tuple(parse_float(x) for x in ls[:3]), float(ls[3])
 
         if val.startswith("#"):
-            if len(val[1:]) == 3 or len(val[1:]) == 6:  # hex is in web format
+            digits = len(val) - 1
+            if digits == 3 or digits == 6:  # hex is in web format
                 super(Color, self).__init__(val)
-            elif len(val[1:]) == 4:
+            elif digits == 4:
                 self.__dict__.__setitem__("alpha", int(val[-1:], 16) / 15)
                 super(Color, self).__init__(val[:-1])
-            elif len(val[1:]) == 8:
+            elif digits == 8:
                 self.__dict__.__setitem__("alpha", int(val[-2:], 16) / 255)
                 super(Color, self).__init__(val[:-2])
         elif val.startswith("rgba"):
@@ -60,3 +63,9 @@ class Color(Col):
         return super(Color, self).__eq__(other)
 
 
+@lru_cache()
+def parse_color(val: str) -> Color:
+    """Parse a color, the same expected colors get compared against every rule
+    Colors are never modified after parsing, so the instances can be shared
+    """
+    return Color(val)
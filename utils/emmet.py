@@ -1,8 +1,18 @@
-from emmet import parse_markup_abbreviation, AbbreviationAttribute, AbbreviationNode
+from collections import deque
+from functools import lru_cache
+from typing import List
+
+from emmet import parse_markup_abbreviation, Abbreviation, AbbreviationAttribute, AbbreviationNode
 
 from validators.checks import TestSuite, Element, all_of, EmptyElement, Check
 
 
+@lru_cache()
+def parse_abbreviation(emmet_str: str) -> Abbreviation:
+    """Parse an emmet expression once, the parsed tree is only read and never modified"""
+    return parse_markup_abbreviation(emmet_str)
+
+
 def emmet_to_check(emmet_str: str, suite: TestSuite) -> Check:
     """Converts an emmet expression to a Check"""
 
@@ -10,7 +20,7 @@ def emmet_to_check(emmet_str: str, suite: TestSuite) -> Check:
     if "$" in emmet_str:
         return EmptyElement().exists()
 
-    parsed = parse_markup_abbreviation(emmet_str)
+    parsed = parse_abbreviation(emmet_str)
 
     def make_params(node: AbbreviationNode):
         """convert attributes & text to a dict"""
@@ -26,16 +36,16 @@ def emmet_to_check(emmet_str: str, suite: TestSuite) -> Check:
                     val = " ".join(a.value)
                     if val.strip().upper() == "DUMMY":
                         # dummy values
-                        out.update({a.name: True})
+                        out[a.name] = True
                     else:
                         # normal values, this is a list
-                        out.update({a.name: " ".join(a.value)})
+                        out[a.name] = val
         if node.value:
             val = " ".join(node.value)
             if val.strip().upper() == "DUMMY":
-                out.update({"text": True})
+                out["text"] = True
             else:
-                out.update({"text": " ".join(node.value)})
+                out["text"] = val
         return out
 
     def match_one(ls: [Element], node: AbbreviationNode):
@@ -50,20 +60,18 @@ def emmet_to_check(emmet_str: str, suite: TestSuite) -> Check:
                 return EmptyElement(), node
         return ls[0], node
 
-    ls = []
     # the roots (plural because of possible siblings)
-    for root_child in parsed.children:
-        params = make_params(root_child)
-        ls.append(match_one(suite.all_elements(root_child.name, **params), root_child))
-    # now we go deeper in the tree (if possible)
+    queue = deque(match_one(suite.all_elements(root_child.name, **make_params(root_child)), root_child)
+                  for root_child in parsed.children)
+    # now we go deeper in the tree (if possible), parents are replaced by their children
+    leaves: List[Element] = []
     el: Element
-    length = len(ls)
-    while length > 0:
-        if ls[0][1].children:
-            el, abr = ls.pop(0)
+    while queue:
+        el, abr = queue.popleft()
+        if abr.children:
             for child in abr.children:
                 kwargs = make_params(child)
-                ls.append(match_one(el.get_children(child.name, direct=True, **kwargs), child))
-                length += 1
-        length -= 1
-    return all_of(*[x[0].exists() for x in ls])
+                queue.append(match_one(el.get_children(child.name, direct=True, **kwargs), child))
+        else:
+            leaves.append(el)
+    return all_of(*[x.exists() for x in leaves])
@@ -41,13 +41,13 @@ class EvaluationModule(ModuleType):
 
         # Read raw content of .py file
         with open(custom_evaluator_path, "r") as fp:
-            # Compile the code into bytecode
-            evaluator_script = compile(fp.read(), "<string>", "exec")
+            # Compile the code into bytecode, use the real path so tracebacks point to the file
+            evaluator_script = compile(fp.read(), custom_evaluator_path, "exec")
 
-            # Create a new module
-            evaluator_module = cls("evaluation", config)
+        # Create a new module
+        evaluator_module = cls("evaluation", config)
 
-            # Build the bytecode & add to the new module
-            exec(evaluator_script, evaluator_module.__dict__)
+        # Build the bytecode & add to the new module
+        exec(evaluator_script, evaluator_module.__dict__)
 
-            return evaluator_module
+        return evaluator_module
@@ -1,6 +1,7 @@
 """
 util file with functions to load specific types of files
 """
+import json
 
 
 def html_loader(file_path: str, **kwargs) -> str:
@@ -20,13 +21,13 @@ def html_loader(file_path: str, **kwargs) -> str:
         content = file.read()
 
         if kwargs.get("wrap_head", False):
-            content = f"<head>{content}<head>"
+            content = f"<head>{content}</head>"
 
         if kwargs.get("wrap_body", False):
-            content = f"<body>{content}<body>"
+            content = f"<body>{content}</body>"
 
         if kwargs.get("wrap_html", False):
-            content = f"<html lang='en'>{content}<html>"
+            content = f"<html lang='en'>{content}</html>"
 
         return content
 
@@ -43,5 +44,4 @@ def json_loader(file_path: str, **kwargs) -> dict:
         file_path += ".json"
 
     with open(file_path, "r") as f:
-        import json
         return json.load(f)
@@ -1,5 +1,6 @@
 from __future__ import annotations
-from typing import TYPE_CHECKING, List, Iterable
+from collections.abc import Iterable
+from typing import TYPE_CHECKING, List
 
 if TYPE_CHECKING:
     from validators.checks import Checks, Check
@@ -9,22 +10,26 @@ def flatten_queue(*queue: Checks) -> List["Check"]:
     """Flatten the queue to allow nested lists to be put inside of it"""
     # *args creates tuples so cast the arg into a list first
     # in case it was used in that context (usually)
-    queue = list(queue)
+    # Keep it reversed, so popping from the end takes the first check
+    # without shifting the rest of the list
+    stack = list(queue)
+    stack.reverse()
 
     flattened: List["Check"] = []
 
-    while queue:
-        el = queue.pop(0)
+    while stack:
+        el = stack.pop()
 
         # This entry is an iterable too, unpack it
         # & add to front of the queue
-        if isinstance(el, Iterable):
+        # Push in reverse to keep the order of checks!
+        if isinstance(el, (list, tuple)):
+            # Nested lists are by far the most common, skip the Iterable ABC check
+            stack.extend(reversed(el))
+        elif isinstance(el, Iterable) and not isinstance(el, (str, bytes)):
             # Cast to a list first (allows map, generators, ...)
-            el = list(el)
-
-            # Iterate in reverse to keep the order of checks!
-            for nested_el in reversed(el):
-                queue.insert(0, nested_el)
+            # Strings are never unpacked, a single character would be unpacked forever
+            stack.extend(reversed(list(el)))
         else:
             flattened.append(el)
 
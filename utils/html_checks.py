@@ -1,14 +1,40 @@
+import re
+
 from bs4 import BeautifulSoup
 
+# Only plain comments, without "--" inside and not starting with ">" or "->",
+# every html.parser version agrees on where those end
+_comment_re = re.compile(r"<!--(?!-?>)(?:(?!--).)*-->", re.DOTALL)
+# A complete start tag, optionally after comments and doctypes, html.parser always turns this into a tag
+# Comments and doctypes share one loop, they can't overlap so a failed match can't backtrack into them
+_start_tag_re = re.compile(rf"(?:{_comment_re.pattern}\s*|<!doctype[^<>]*>\s*)*"
+                           r"<[a-zA-Z][a-zA-Z0-9-]*"
+                           r"(?:\s+[^\s\"'<>/=]+(?:\s*=\s*(?:\"[^\"]*\"|'[^']*'|[^\s\"'<>=`]+))?)*\s*/?>",
+                           re.IGNORECASE | re.DOTALL)
+
 
 def is_empty_document(document: str) -> bool:
-    """Check if a document is empty, not allowing comments"""
+    """Check if a document is empty, not allowing comments
+
+    >>> is_empty_document("<!-- comment --> <p>text</p>")
+    False
+    >>> is_empty_document("<!-- comment --> " * 5000 + "<1")
+    True
+    """
     document = document.strip()
 
     # Completely empty (barring whitespace)
     if not document:
         return True
 
+    # Without any "<" outside of comments there can't be a tag, no need to parse it
+    if "<" not in _comment_re.sub("", document):
+        return True
+
+    # Most submissions start with the doctype or a tag right away
+    if _start_tag_re.match(document):
+        return False
+
     try:
         parsed = BeautifulSoup(document, "html.parser")
     except Exception:
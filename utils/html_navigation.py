@@ -3,9 +3,19 @@ from typing import Optional, Union, List
 from bs4 import BeautifulSoup
 from bs4.element import Tag, Comment
 
+# Compiled once, find_emmet runs these for every part of every path
+# Tag must always be in the beginning, otherwise we can't parse it out
+tag_re = re.compile(r"^[a-zA-Z0-9]+")
+id_re = re.compile(r"#([a-zA-Z0-9_-]+)")
+index_re = re.compile(r"\[(-?)([0-9]+)\]$")
+# Cannot start with a digit, two hyphens or a hyphen followed by a number.
+illegal_class_re = re.compile(r"\.([0-9]|--|-[0-9])")
+class_re = re.compile(r"\.([a-zA-Z0-9_-]+)")
+
 
 def match_emmet(tag: Optional[str]) -> bool:
-    return tag is not None and tag and re.match(r"^[a-zA-Z0-9]+$", tag) is None
+    # Plain tag names are ASCII letters and digits only, anything else is emmet syntax
+    return bool(tag) and not (tag.isascii() and tag.isalnum())
 
 
 def find_child(element: Optional[Union[BeautifulSoup, Tag]],
@@ -63,42 +73,33 @@ def find_emmet(element: Optional[Union[BeautifulSoup, Tag]], path: str, ind: int
     if element is None:
         return None
 
-    # Tag must always be in the beginning, otherwise we can't parse it out
-    tag_regex = re.compile(r"^[a-zA-Z0-9]+")
-    id_regex = re.compile(r"#([a-zA-Z0-9_-]+)")
-    index_regex = re.compile(r"\[(-?)([0-9]+)\]$")
-
-    # Cannot start with a digit, two hyphens or a hyphen followed by a number.
-    illegal_class_regex = re.compile(r"\.([0-9]|--|-[0-9])")
-    class_regex = re.compile(r"\.([a-zA-Z0-9_-]+)")
-
-    path_stack: List[str] = path.split(">")
+    segments: List[str] = path.split(">")
+    last_index = len(segments) - 1
 
     # the from_root should only be done once, afterwards it's always True to support this syntax
     moved = False
     current_element = element
 
-    # Keep going until path is empty
-    while path_stack:
+    # Walk the path one entry at a time
+    for i, current_entry in enumerate(segments):
         if current_element is None:
             return None
 
-        # Take first entry from stack
-        current_entry = path_stack.pop(0)
+        is_last = i == last_index
 
         # Element is empty, so return all children
         if not current_entry:
             return current_element.children
 
         # Illegal class name
-        if illegal_class_regex.search(current_entry) is not None:
+        if illegal_class_re.search(current_entry) is not None:
             return None
 
-        tag = tag_regex.search(current_entry)
-        id_match = id_regex.search(current_entry)
+        tag = tag_re.search(current_entry)
+        id_match = id_re.search(current_entry)
         # Multiple class names allowed
-        class_names = class_regex.findall(current_entry)
-        index = index_regex.search(current_entry)
+        class_names = class_re.findall(current_entry)
+        index = index_re.search(current_entry)
 
         # Kwargs to filter on
         filter_kwargs = {}
@@ -127,11 +128,11 @@ def find_emmet(element: Optional[Union[BeautifulSoup, Tag]], path: str, ind: int
         else:
             # Take the first arg, but if an index was specified as a parameter
             # and this is the last part of the path, then use that index
-            index = 0 if path_stack else ind
+            index = ind if is_last else 0
 
         # Apply kwargs to the end of the path only,
         # and the path takes priority so it overrides the others
-        if not path_stack:
+        if is_last:
             filter_kwargs = kwargs | filter_kwargs
 
         # Apply filters & find a matching element
@@ -143,7 +144,7 @@ def find_emmet(element: Optional[Union[BeautifulSoup, Tag]], path: str, ind: int
             return None
 
         # End of path reached
-        if not path_stack:
+        if is_last:
             # Return all matches
             if match_multiple:
                 return matches
@@ -158,15 +159,41 @@ def find_emmet(element: Optional[Union[BeautifulSoup, Tag]], path: str, ind: int
     return current_element
 
 
+def tag_children(element: Union[BeautifulSoup, Tag], direct: bool = True) -> List[Tag]:
+    """Get the children (or descendants) of an element without the string content
+    the list is stored on the element itself, so every later call reuses it
+    """
+    key = "_tag_children" if direct else "_tag_descendants"
+
+    # Looked up in __dict__ directly, bs4 turns unknown attributes into a find() call
+    cached = element.__dict__.get(key)
+
+    if cached is None:
+        cached = [child for child in (element.children if direct else element.descendants) if isinstance(child, Tag)]
+        element.__dict__[key] = cached
+
+    return cached
+
+
+def tag_text(element: Union[BeautifulSoup, Tag]) -> str:
+    """Get the text of an element, bs4 joins all descendant strings again on every access
+    so the result is stored on the element itself, just like tag_children
+    """
+    cached = element.__dict__.get("_tag_text")
+
+    if cached is None:
+        cached = element.get_text()
+        element.__dict__["_tag_text"] = cached
+
+    return cached
+
+
 def compare_content(first: str, second: str, case_insensitive: bool = False) -> bool:
     """Check if content of two strings is equal, ignoring all whitespace"""
     # Remove all leading/trailing whitespace, and replace all other whitespace by single spaces
-    # in both argument and content
-    element_text = first.strip()
-    arg_text = second.strip()
-
-    element_text = re.sub(r"\s+", " ", element_text, re.MULTILINE)
-    arg_text = re.sub(r"\s+", " ", arg_text, re.MULTILINE)
+    # in both argument and content, split() does both in one pass without a regex
+    element_text = " ".join(first.split())
+    arg_text = " ".join(second.split())
 
     if case_insensitive:
         element_text = element_text.lower()
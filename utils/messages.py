@@ -19,6 +19,19 @@ def invalid_suites(judge: SimpleNamespace, config: DodonaConfig):
     judge.accepted = False
 
 
+def invalid_submission(judge: SimpleNamespace, config: DodonaConfig):
+    """Show the students a message saying that their submission is not a valid graph"""
+    with Message(
+            description=config.translator.translate(
+                Translator.Text.INVALID_SUBMISSION),
+            format=MessageFormat.TEXT
+    ):
+        pass
+
+    judge.status = config.translator.error_status(ErrorType.COMPILATION_ERROR)
+    judge.accepted = False
+
+
 def invalid_evaluator_file(exception: Exception):
     """Show the teacher a message saying that their evaluator file is invalid"""
     with Message(
@@ -1,6 +1,7 @@
 import bs4
 from bs4.element import Tag
 from ntpath import basename
+from typing import List, Optional
 from validators.css_validator import Rules, Rule
 
 
@@ -14,8 +15,23 @@ def prep_render(html_content: str, render_css: bool) -> (str, str):
     try:
         soup = bs4.BeautifulSoup(html_content, "html.parser")
 
+        # Collect everything that gets changed in one walk over the tree,
+        # only the first title, body and style are used
+        title: Optional[Tag] = None
+        body: Optional[Tag] = None
+        style: Optional[Tag] = None
+        images: List[Tag] = []
+        for tag in soup.find_all(True):
+            if tag.name == "title" and title is None:
+                title = tag
+            elif tag.name == "body" and body is None:
+                body = tag
+            elif tag.name == "style" and style is None:
+                style = tag
+            elif tag.name == "img" and tag.has_attr("src"):
+                images.append(tag)
+
         # remove title
-        title: Tag = soup.find("title")
         if title is not None:
             title_str = title.text
             title.decompose()
@@ -25,8 +41,6 @@ def prep_render(html_content: str, render_css: bool) -> (str, str):
         # wrap div around the contents of body
         div = soup.new_tag("div", attrs={"id": "solution_rendering"})
 
-        body = soup.find("body")
-
         if body is not None:
             body.wrap(div)
             attrs = body.attrs
@@ -34,7 +48,7 @@ def prep_render(html_content: str, render_css: bool) -> (str, str):
             div.wrap(soup.new_tag("body", attrs=attrs))
 
         # Change all img src's to refer to the /media directory
-        for img in soup.find_all("img", src=True):
+        for img in images:
             src = img.get("src")
 
             # Ignore internet URLs, don't use some fancy package for this, this is good enough
@@ -45,7 +59,6 @@ def prep_render(html_content: str, render_css: bool) -> (str, str):
 
                 img["src"] = f"media/{filename}"
 
-        style = soup.find("style")
         if style is not None:
             # Css should not be rendered, remove it from the tree
             if not render_css:
@@ -57,11 +70,10 @@ def prep_render(html_content: str, render_css: bool) -> (str, str):
                 for x in rs.rules:
                     x.selector_str = f"#solution_rendering {x.selector_str}"
 
-                new_style = ""
-                for r in rs.rules:
-                    new_style += f"{r.selector_str}" + "{" + f"{r.name}:{r.value_str}{'!important' if r.important else ''}" + ";}\n   "
-
-                style.string = new_style
+                # Join once instead of growing the string rule by rule
+                style.string = "".join(
+                    f"{r.selector_str}{{{r.name}:{r.value_str}{'!important' if r.important else ''};}}\n   "
+                    for r in rs.rules)
 
         return title_str, str(soup.prettify())
     except Exception:
@@ -3,7 +3,8 @@ import re
 from collections import deque
 from copy import copy
 from dataclasses import dataclass, field
-from typing import Deque, List, Optional, Callable, Union, Dict, TypeVar, Iterable, Iterator
+from functools import cached_property
+from typing import Deque, List, Optional, Callable, Union, Dict, TypeVar, Iterable, Iterator, Tuple
 from urllib.parse import urlsplit
 
 from bs4 import BeautifulSoup
@@ -17,11 +18,11 @@ from exceptions.double_char_exceptions import MultipleMissingCharsError, Locatab
 from exceptions.html_exceptions import Warnings, LocatableHtmlValidationError
 from exceptions.utils import EvaluationAborted
 from utils.flatten import flatten_queue
-from utils.html_navigation import find_child, compare_content, match_emmet, find_emmet, contains_comment
+from utils.html_navigation import find_child, compare_content, match_emmet, find_emmet, contains_comment, tag_children, tag_text
 from utils.regexes import doctype_re
 from validators.css_validator import CssValidator, CssParsingError, Rule, AmbiguousXpath, ElementNotFound
 from validators.html_validator import HtmlValidator
-import ast
+import json
 
 # Custom type hints
 Emmet = TypeVar("Emmet", bound=str)
@@ -141,16 +142,16 @@ class Element:
             # Nothing found
             if matches is None:
                 return ElementContainer([])
+        elif tag is not None and direct and not kwargs:
+            # Plain tag name among the direct children, no need for bs4's matching
+            matches = [child for child in tag_children(self._element) if child.name == tag]
         elif tag is not None:
             # If a tag was specified, only search for those
             matches = self._element.find_all(
                 tag, recursive=not direct, **kwargs)
         else:
-            # Otherwise, use all children instead
-            matches = self._element.children if direct else self._element.descendants
-
-            # Filter out string content
-            matches = list(filter(lambda x: isinstance(x, Tag), matches))
+            # Otherwise, use all children instead (without the string content)
+            matches = tag_children(self._element, direct)
 
         return ElementContainer.from_tags(matches, self._css_validator)
 
@@ -184,30 +185,18 @@ class Element:
             if self._element is None:
                 return False
 
-            first_matching_parent = self._element.find_parent(
-                name=tag, **kwargs)
-
-            # No parents matched
-            if first_matching_parent is None:
-                return False
-
             if not direct:
                 # Not direct, any matching parent will do
-                # we already have one (found above) so we can return True here
-                return True
+                return self._element.find_parent(name=tag, **kwargs) is not None
 
-            # Get direct parent
-            direct_parent = self._element.find_parent()
+            direct_parent = self._element.parent
 
-            # No parents found
-            # shouldn't happen, but just in case
-            if direct_parent is None:
+            # Only the direct parent can match, so check its name before searching
+            if direct_parent is None or direct_parent.name != tag:
                 return False
 
-            # Check if the direct parent is the same as the first parent that matched
-            # Using eq should be safe here because different levels of parents should have
-            # different child elements
-            return first_matching_parent == direct_parent
+            # Let bs4 match the kwargs, the first matching parent has to be the direct parent itself
+            return self._element.find_parent(name=tag, **kwargs) is direct_parent
 
         return Check(_inner)
 
@@ -228,14 +217,16 @@ class Element:
         """
 
         def _inner(_: BeautifulSoup) -> bool:
+            content = tag_text(self._element)
+
             # No text in this element
-            if self._element.text is None or len(self._element.text) == 0:
+            if not content:
                 return False
 
             if text is not None:
-                return compare_content(self._element.text, text, case_insensitive)
+                return compare_content(content, text, case_insensitive)
 
-            return len(self._element.text.strip()) > 0
+            return len(content.strip()) > 0
 
         return Check(_inner)
 
@@ -276,7 +267,7 @@ class Element:
 
         return attribute
 
-    def _compare_attribute_list(self, attribute: List[str], value: Optional[str] = None,
+    def _compare_attribute_list(self, attribute: List[str], value: Optional[Union[str, re.Pattern]] = None,
                                 case_insensitive: bool = False,
                                 mode: int = 0, flags: Union[int, re.RegexFlag] = 0) -> bool:
         """Attribute check for attributes that contain lists (eg. Class). Can handle all 3 modes.
@@ -292,25 +283,32 @@ class Element:
         if value is None:
             return True
 
-        if case_insensitive:
-            value = value.lower()
-            attribute = list(map(lambda x: x.lower(), attribute))
-
+        # Lowercase the entries one by one so the loops can stop at the first match
         # Exact match
         if mode == 0:
+            if case_insensitive:
+                value = value.lower()
+                return any(v.lower() == value for v in attribute)
+
             return value in attribute
 
         # Contains substring
         if mode == 1:
+            if case_insensitive:
+                value = value.lower()
+                return any(value in v.lower() for v in attribute)
+
             return any(value in v for v in attribute)
 
         # Match regex
         if mode == 2:
-            for v in attribute:
-                if re.search(value, v, flags) is not None:
-                    return True
+            # Already compiled patterns are used as-is, their flags can't be changed anymore
+            if isinstance(value, re.Pattern):
+                pattern = value
+            else:
+                pattern = re.compile(value, flags | re.IGNORECASE if case_insensitive else flags)
 
-            return False
+            return any(pattern.search(v) is not None for v in attribute)
 
         # Possible future modes
         return False
@@ -368,6 +366,8 @@ class Element:
     @html_check
     def attribute_matches(self, attr: str, regex: str, flags: Union[int, re.RegexFlag] = 0) -> Check:
         """Check that the value of an attribute matches a regex pattern"""
+        # Compile once here instead of every time the check runs
+        pattern = re.compile(regex, flags)
 
         def _inner(_: BeautifulSoup) -> bool:
             attribute = self._get_attribute(attr)
@@ -377,9 +377,9 @@ class Element:
                 return False
 
             if isinstance(attribute, list):
-                return self._compare_attribute_list(attribute, regex, mode=2, flags=flags)
+                return self._compare_attribute_list(attribute, pattern, mode=2)
 
-            return re.search(regex, attribute, flags) is not None
+            return pattern.search(attribute) is not None
 
         return Check(_inner)
 
@@ -400,11 +400,7 @@ class Element:
                 return False
 
             # Check if all headers have the same content in the same order
-            for i in range(len(header)):
-                if not compare_content(header[i], ths[i].text):
-                    return False
-
-            return True
+            return all(compare_content(expected, tag_text(th)) for expected, th in zip(header, ths))
 
         return Check(_inner)
 
@@ -441,17 +437,17 @@ class Element:
                 return False
 
             # Compare tds (actual data)
-            for i in range(len(rows)):
-                data = trs[i].find_all("td")
+            for tr, row in zip(trs, rows):
+                data = tr.find_all("td")
 
                 # Row doesn't have the same amount of tds
-                if len(data) != len(rows[i]):
+                if len(data) != len(row):
                     return False
 
                 # Compare content
-                for j in range(len(rows[i])):
+                for td, expected in zip(data, row):
                     # Content doesn't match
-                    if not compare_content(data[j].text, rows[i][j], case_insensitive):
+                    if not compare_content(tag_text(td), expected, case_insensitive):
                         return False
 
             return True
@@ -473,12 +469,7 @@ class Element:
             if len(tds) != len(row):
                 return False
 
-            for i in range(len(row)):
-                # Text doesn't match
-                if not compare_content(row[i], tds[i].text, case_insensitive):
-                    return False
-
-            return True
+            return all(compare_content(expected, tag_text(td), case_insensitive) for expected, td in zip(row, tds))
 
         return Check(_inner)
 
@@ -700,8 +691,7 @@ class ElementContainer:
     @classmethod
     def from_tags(cls, tags: List[Tag], css_validator: CssValidator) -> "ElementContainer":
         """Construct a container from a list of bs4 Tag instances"""
-        elements = list(map(lambda x: Element(
-            x.name, x.get("id", None), x, css_validator), tags))
+        elements = [Element(x.name, x.get("id"), x, css_validator) for x in tags]
         return ElementContainer(elements)
 
     def get(self, index: int) -> Element:
@@ -763,10 +753,8 @@ class ChecklistItem:
 
     def __init__(self, message: str, *checks: Checks):
         self.message = message
-        self._checks = []
 
         # Flatten the list of checks and store in internal list
-        checks = flatten_queue(checks)
         self._checks = flatten_queue(checks)
 
     def _process_one(self, check: Check, bs: BeautifulSoup, language: str) -> bool:
@@ -777,13 +765,13 @@ class ChecklistItem:
 
     def evaluate(self, bs: BeautifulSoup, language: str) -> bool:
         """Evaluate all checks inside of this item"""
-        queue = copy(self._checks)
+        queue: Deque[Check] = deque(self._checks)
 
         should_abort = False
         success = True
 
         while queue:
-            check = queue.pop(0)
+            check = queue.popleft()
 
             # Check failed
             if not self._process_one(check, bs, language):
@@ -803,8 +791,8 @@ class ChecklistItem:
                     success = False
 
             # Check succeeded, add all on_success checks
-            for os_check in reversed(check.on_success):
-                queue.insert(0, os_check)
+            # extendleft reverses them, so they keep their order at the front
+            queue.extendleft(reversed(check.on_success))
 
         # Abort future items
         if should_abort:
@@ -1438,16 +1426,28 @@ class CVGSuite(BoilerplateTestSuite):
     def __init__(self, content: str, solution: str, check_recommended: bool = True, allow_warnings: bool = True, abort: bool = True, check_minimal: bool = False):
         super().__init__("CVG", content, check_recommended, check_minimal)
 
-        content = ast.literal_eval(content)
+        content = json.loads(content)
         # print(content)
-        self.cont_nodes = content["nodes"]
+        # Sort once here, the order of the nodes doesn't matter
+        self.cont_nodes = sorted(content["nodes"])
         self.cont_edges = content["edges"]
 
-        solution_content: str = solution
-        self.sol_nodes = solution_content["nodes"]
+        solution_content: dict = json.loads(solution) if isinstance(
+            solution, str) else solution
+        self.sol_nodes = sorted(solution_content["nodes"])
         self.sol_edges = solution_content["edges"]
         self.succes_tests = True
 
+    @cached_property
+    def _cont_edge_tuples(self) -> List[Tuple[str, str, bool]]:
+        """The submitted edges as sorted (from, to, dashes) tuples"""
+        return sorted((edge["from"], edge["to"], edge["dashes"]) for edge in self.cont_edges)
+
+    @cached_property
+    def _sol_edge_tuples(self) -> List[Tuple[str, str, bool]]:
+        """The solution edges as sorted (from, to, dashes) tuples"""
+        return sorted((edge["from"], edge["to"], edge["dashes"]) for edge in self.sol_edges)
+
     def return_true(self) -> Check:
         def _inner(_: BeautifulSoup) -> bool:
             return True
@@ -1461,91 +1461,61 @@ class CVGSuite(BoilerplateTestSuite):
     def compare_nodeslength(self) -> Check:
 
         def _inner(_: BeautifulSoup) -> bool:
-
-            if (self.succes_tests != False):
-                self.succes_tests = len(self.sol_nodes) == len(self.cont_nodes)
-            return (len(self.sol_nodes) == len(self.cont_nodes))
+            ok = len(self.sol_nodes) == len(self.cont_nodes)
+            # One failed check makes the whole graph incorrect
+            if not ok:
+                self.succes_tests = False
+            return ok
         return Check(_inner)
 
     def compare_edgeslength(self) -> Check:
 
         def _inner(_: BeautifulSoup) -> bool:
-            if (self.succes_tests != False):
-                self.succes_tests = len(self.sol_edges) == len(self.cont_edges)
-            return (len(self.sol_edges) == len(self.cont_edges))
+            ok = len(self.sol_edges) == len(self.cont_edges)
+            if not ok:
+                self.succes_tests = False
+            return ok
         return Check(_inner)
 
     def correct_nodes(self) -> Check:
 
         def _inner(_: BeautifulSoup) -> bool:
-            self.cont_nodes.sort()
-            self.sol_nodes.sort()
-            if (self.succes_tests != False):
-                self.succes_tests = (self.cont_nodes == self.sol_nodes)
-            return (self.cont_nodes == self.sol_nodes)
+            ok = self.cont_nodes == self.sol_nodes
+            if not ok:
+                self.succes_tests = False
+            return ok
 
         return Check(_inner)
 
     def correct_edges(self) -> Check:
 
         def _inner(_: BeautifulSoup) -> bool:
-            # 0: from , #1: to , #2 : dashes
-            user_edges = []
-            sol_edges = []
-            for i, edge in enumerate(self.cont_edges):
-                temp_edge = [0, 0, 0]
-                temp_edge[0] = edge["from"]
-                temp_edge[1] = edge["to"]
-                temp_edge[2] = edge["dashes"]
-                user_edges.append(temp_edge)
-
-            for i, edge in enumerate(self.sol_edges):
-                temp_edge = [0, 0, 0]
-                temp_edge[0] = edge["from"]
-                temp_edge[1] = edge["to"]
-                temp_edge[2] = edge["dashes"]
-                sol_edges.append(temp_edge)
-            user_edges.sort()
-            sol_edges.sort()
-            if len(user_edges) != len(sol_edges):
+            # A different amount of edges can never match, skip sorting them
+            if len(self.cont_edges) != len(self.sol_edges):
+                self.succes_tests = False
                 return False
-            for i in range(len(user_edges)):
-                if user_edges[i][0] != sol_edges[i][0] or user_edges[i][1] != sol_edges[i][1]:
-                    self.succes_tests == False
-                    return False
-            return True
+
+            # Only the direction matters here, dashes are checked in correct_stippel
+            user_edges = [edge[:2] for edge in self._cont_edge_tuples]
+            sol_edges = [edge[:2] for edge in self._sol_edge_tuples]
+            ok = user_edges == sol_edges
+            if not ok:
+                self.succes_tests = False
+            return ok
 
         return Check(_inner)
 
     def correct_stippel(self) -> Check:
 
         def _inner(_: BeautifulSoup) -> bool:
-            # 0: from , #1: to , #2 : dashes
-            user_edges = []
-            sol_edges = []
-            for i, edge in enumerate(self.cont_edges):
-                temp_edge = [0, 0, 0]
-                temp_edge[0] = edge["from"]
-                temp_edge[1] = edge["to"]
-                temp_edge[2] = edge["dashes"]
-                user_edges.append(temp_edge)
-
-            for i, edge in enumerate(self.sol_edges):
-                temp_edge = [0, 0, 0]
-                temp_edge[0] = edge["from"]
-                temp_edge[1] = edge["to"]
-                temp_edge[2] = edge["dashes"]
-                sol_edges.append(temp_edge)
-            user_edges.sort()
-            sol_edges.sort()
-            if len(user_edges) != len(sol_edges):
-                self.succes_tests == False
+            if len(self.cont_edges) != len(self.sol_edges):
+                self.succes_tests = False
                 return False
-            for i in range(len(user_edges)):
-                if user_edges[i][0] != sol_edges[i][0] or user_edges[i][1] != sol_edges[i][1] or user_edges[i][2] != sol_edges[i][2]:
-                    self.succes_tests == False
-                    return False
-            return True
+
+            ok = self._cont_edge_tuples == self._sol_edge_tuples
+            if not ok:
+                self.succes_tests = False
+            return ok
 
         return Check(_inner)
 
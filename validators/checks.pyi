@@ -1,4 +1,4 @@
-from re import RegexFlag
+from re import Pattern, RegexFlag
 
 from bs4 import BeautifulSoup
 from bs4.element import Tag
@@ -84,7 +84,7 @@ class Element:
 
     def _get_attribute(self, attr: str) -> Optional[Union[List[str], str]]: ...
 
-    def _compare_attribute_list(self, attribute: List[str], value: Optional[str] = None,
+    def _compare_attribute_list(self, attribute: List[str], value: Optional[Union[str, Pattern]] = None,
                                 case_insensitive: bool = False,
                                 mode: int = 0, flags: Union[int, RegexFlag] = 0) -> bool: ...
 
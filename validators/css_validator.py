@@ -8,7 +8,7 @@ from lxml.etree import ElementBase
 from lxml.html import fromstring
 from tinycss2.ast import *
 
-from utils.color_converter import Color
+from utils.color_converter import parse_color
 
 """
 tinycss2 docs
@@ -89,7 +89,7 @@ class Rule:
         self.color = None
         if self.is_color():
             try:
-                self.color = Color(self.value_str)
+                self.color = parse_color(self.value_str)
             except (IndexError, ValueError):
                 raise CssParsingError()
 
@@ -107,7 +107,7 @@ class Rule:
             return False
 
         try:
-            other = Color(color)
+            other = parse_color(color)
         except ValueError:
             return False  # if the other color is not-parsable than it is the programmers fault
         return self.color == other
@@ -314,6 +314,7 @@ class CssValidator:
             self.rules.root = self.root
 
         self.xpaths = {}
+        self.found: Dict[Tuple[int, str, Optional[str]], Optional[Rule]] = {}
 
     def __bool__(self):
         return bool(self.rules.rules)
@@ -345,11 +346,21 @@ class CssValidator:
 
     def find(self, element: Tag, key: str, pseudo: Optional[str] = None) -> Optional[Rule]:
         """find the css rule for key (ex: color) for the solution_element
-        the element should be a BeautifulSoup Tag"""
+        the element should be a BeautifulSoup Tag
+        this is the memorization of the private function, checks often ask for the same
+        properties of the same elements (and their parents when inheriting)"""
         # Tree couldn't be parsed so can't perform searching
         if self.root is None:
             return None
 
+        memo_key = (id(element), key, pseudo)
+        if memo_key not in self.found:
+            self.found[memo_key] = self._find(element, key, pseudo)
+        return self.found[memo_key]
+
+    def _find(self, element: Tag, key: str, pseudo: Optional[str] = None) -> Optional[Rule]:
+        """find the css rule for key (ex: color) for the solution_element"""
+
         xpath_solution = self.get_xpath_soup(element)
 
         # LXML adds a root HTML tag if there is none present, which results in
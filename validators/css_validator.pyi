@@ -73,6 +73,7 @@ class CssValidator:
     root: Optional[ElementBase]
     rules: Rules
     xpaths: Dict
+    found: Dict[Tuple[int, str, Optional[str]], Optional[Rule]]
 
     def __init__(self, html: str): ...
     
@@ -84,4 +85,6 @@ class CssValidator:
 
     def find(self, element: Tag, key: str, pseudo: Optional[str] = None) -> Optional[Rule]: ...
 
+    def _find(self, element: Tag, key: str, pseudo: Optional[str] = None) -> Optional[Rule]: ...
+
     def find_by_css_selector(self, css_selector: str, key: str) -> Optional[Rule]: ...